@@ -6,9 +6,17 @@ and coordination between local and cloud models.
 """
 
 import os
+import re
 import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import math
+import heapq
+import functools
+from time import perf_counter, time as wall_time
+from collections import Counter, defaultdict, deque
+from typing import Deque, Dict, FrozenSet, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
 
 try:
     from agentscope import Agent, Msg
@@ -35,6 +43,95 @@ except ImportError:
         def get_memory(self):
             return self.memory
 
+# Import the sibling kernel module relative to the package when there is one,
+# directly when run as a script; it provides the compiled kernels when built
+if __package__:
+    from .router_kernels import (
+        AOT_COMPILED, CAP_ADVANCED, CAP_CODE, CAP_COMPLEX, CAP_GENERAL,
+        CAP_MULTIMODAL, CAP_PROGRAMMING, CAP_REASONING, scan_keywords, score_models,
+    )
+else:
+    from router_kernels import (
+        AOT_COMPILED, CAP_ADVANCED, CAP_CODE, CAP_COMPLEX, CAP_GENERAL,
+        CAP_MULTIMODAL, CAP_PROGRAMMING, CAP_REASONING, scan_keywords, score_models,
+    )
+
+# Keyword categories used by query analysis, indexed by category id
+KW_REASONING, KW_CODE, KW_MULTIMODAL, KW_MATH = range(4)
+KW_ALL = (1 << 4) - 1
+
+QUERY_KEYWORDS = {
+    KW_REASONING: ['analyze', 'compare', 'evaluate', 'explain why', 'reasoning', 'logic'],
+    KW_CODE: ['code', 'programming', 'function', 'algorithm', 'debug', 'implement'],
+    KW_MULTIMODAL: ['image', 'picture', 'visual', 'diagram', 'chart'],
+    KW_MATH: ['calculate', 'equation', 'formula', 'mathematics', 'statistics'],
+}
+
+CAPABILITY_BITS = {
+    'code': CAP_CODE,
+    'multimodal': CAP_MULTIMODAL,
+    'complex': CAP_COMPLEX,
+    'reasoning': CAP_REASONING,
+    'advanced': CAP_ADVANCED,
+    'general': CAP_GENERAL,
+    'programming': CAP_PROGRAMMING,
+}
+
+def capability_bits(capabilities: List[str]) -> int:
+    """Translate a list of capability names into a bitmask"""
+    bits = 0
+    for capability in capabilities:
+        bits |= CAPABILITY_BITS.get(capability, 0)
+    return bits
+
+def _build_keyword_dfa(keywords_by_category: Dict[int, List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Compile keywords into a byte-level Aho-Corasick DFA (goto table, output masks)"""
+    # Build the trie over the UTF-8 bytes of every keyword
+    trie = [{}]
+    out = [0]
+    for category_id, keywords in keywords_by_category.items():
+        for keyword in keywords:
+            state = 0
+            for byte in keyword.encode('utf-8'):
+                if byte not in trie[state]:
+                    trie.append({})
+                    out.append(0)
+                    trie[state][byte] = len(trie) - 1
+                state = trie[state][byte]
+            out[state] |= 1 << category_id
+    
+    # Fold failure links into a full transition table, breadth first
+    goto = np.zeros((len(trie), 256), dtype=np.uint16)
+    out_mask = np.array(out, dtype=np.uint8)
+    fail = [0] * len(trie)
+    queue = []
+    for byte, child in trie[0].items():
+        goto[0, byte] = child
+        queue.append(child)
+    
+    for state in queue:
+        out_mask[state] |= out_mask[fail[state]]
+        goto[state] = goto[fail[state]]
+        for byte, child in trie[state].items():
+            fail[child] = goto[fail[state], byte]
+            goto[state, byte] = child
+            queue.append(child)
+    
+    return goto, out_mask
+
+_KW_GOTO, _KW_OUT_MASK = _build_keyword_dfa(QUERY_KEYWORDS)
+
+# Lowercased query text and its word set, computed once per query
+PreprocessedQuery = Tuple[str, FrozenSet[str]]
+
+_WORD_RE = re.compile(r'\w+')
+
+def _preprocess(query: str) -> PreprocessedQuery:
+    """Lowercase and tokenize a query in a single pass"""
+    query_lower = query.lower()
+    words = frozenset(word for word in _WORD_RE.findall(query_lower) if len(word) > 2)
+    return query_lower, words
+
 @dataclass
 class RoutingDecision:
     """Represents a routing decision for a query"""
@@ -51,6 +148,7 @@ class IntelligentRouter:
         self.config = config
         self.local_models = config.get('local_models', ['llama3.1:8b'])
         self.cloud_models = config.get('cloud_models', ['gpt-4o-mini'])
+        self._available = frozenset(self.local_models) | frozenset(self.cloud_models)
         self.cost_threshold = config.get('cost_threshold', 0.001)
         self.latency_threshold = config.get('latency_threshold', 2000)
         self.quality_threshold = config.get('quality_threshold', 0.8)
@@ -88,47 +186,122 @@ class IntelligentRouter:
                 'max_context': 128000
             }
         }
+        
+        # Static per-model scoring columns, one row per model in model_info
+        self._model_names = list(self.model_info)
+        infos = list(self.model_info.values())
+        costs = np.array([info['cost_per_token'] for info in infos], dtype=np.float64)
+        latencies = np.array([info['avg_latency'] for info in infos], dtype=np.float64)
+        # Cost scoring (higher score for lower cost)
+        self._cost_score = np.maximum(0.0, 1 - costs * 1000)
+        # Speed scoring (higher score for lower latency)
+        self._speed_score = np.maximum(0.0, 1 - latencies / 2000)
+        self._cap_bits = np.array([capability_bits(info['capabilities']) for info in infos],
+                                  dtype=np.uint8)
+        self._available_mask = np.array([model in self._available for model in self._model_names],
+                                        dtype=bool)
+        
+        # Scoring only depends on the requirement bits and preference weights
+        self._score_cached = functools.lru_cache(maxsize=2048)(self._score_models)
+        
+        # Query analysis is pure over the lowercased text and its length bucket
+        self._analyze_cached = functools.lru_cache(maxsize=4096)(self._analyze_impl)
+    
+    def _match_keywords(self, query_lower: str) -> int:
+        """Return a bitmask of the keyword categories found in the query"""
+        # Single pass of the compiled keyword DFA over the query bytes
+        if AOT_COMPILED:
+            buf = np.frombuffer(query_lower.encode('utf-8'), dtype=np.uint8)
+            return int(scan_keywords(buf, _KW_GOTO, _KW_OUT_MASK, KW_ALL))
+        
+        # Fall back to plain substring scans without the compiled kernels
+        hits = 0
+        for category_id, keywords in QUERY_KEYWORDS.items():
+            if any(keyword in query_lower for keyword in keywords):
+                hits |= 1 << category_id
+        return hits
     
-    def analyze_query_complexity(self, query: str, context: Optional[str] = None) -> Dict[str, float]:
+    def analyze_query_complexity(self, query: str, context: Optional[str] = None,
+                                 pp: Optional[PreprocessedQuery] = None) -> Dict[str, float]:
         """Analyze query complexity and requirements"""
-        query_lower = query.lower()
+        query_lower = pp[0] if pp is not None else query.lower()
+        general, code, multimodal, math_req = self._analyze_cached(query_lower, len(query) > 500)
         
+        return {
+            'general_complexity': general,
+            'code_requirement': code,
+            'multimodal_requirement': multimodal,
+            'math_requirement': math_req
+        }
+    
+    def _analyze_impl(self, query_lower: str, is_long: bool) -> Tuple[float, float, float, float]:
+        """Score a lowercased query as (complexity, code, multimodal, math)"""
         # Complexity indicators
         complexity_score = 0.0
         
         # Length-based complexity
-        if len(query) > 500:
+        if is_long:
             complexity_score += 0.2
         
+        hits = self._match_keywords(query_lower)
+        
         # Reasoning indicators
-        reasoning_keywords = ['analyze', 'compare', 'evaluate', 'explain why', 'reasoning', 'logic']
-        if any(keyword in query_lower for keyword in reasoning_keywords):
+        if hits & (1 << KW_REASONING):
             complexity_score += 0.3
         
         # Code-related queries
-        code_keywords = ['code', 'programming', 'function', 'algorithm', 'debug', 'implement']
-        code_score = 0.5 if any(keyword in query_lower for keyword in code_keywords) else 0.0
+        code_score = 0.5 if hits & (1 << KW_CODE) else 0.0
         
         # Multimodal requirements
-        multimodal_keywords = ['image', 'picture', 'visual', 'diagram', 'chart']
-        multimodal_score = 0.8 if any(keyword in query_lower for keyword in multimodal_keywords) else 0.0
+        multimodal_score = 0.8 if hits & (1 << KW_MULTIMODAL) else 0.0
         
         # Mathematical complexity
-        math_keywords = ['calculate', 'equation', 'formula', 'mathematics', 'statistics']
-        math_score = 0.4 if any(keyword in query_lower for keyword in math_keywords) else 0.0
+        math_score = 0.4 if hits & (1 << KW_MATH) else 0.0
         
-        return {
-            'general_complexity': min(complexity_score, 1.0),
-            'code_requirement': code_score,
-            'multimodal_requirement': multimodal_score,
-            'math_requirement': math_score
-        }
+        return min(complexity_score, 1.0), code_score, multimodal_score, math_score
+    
+    def _requirement_bits(self, analysis: Dict[str, float]) -> int:
+        """Reduce a query analysis to the capability bits it calls for"""
+        need_bits = 0
+        if analysis['code_requirement'] > 0.5:
+            need_bits |= CAP_CODE
+        if analysis['multimodal_requirement'] > 0.5:
+            need_bits |= CAP_MULTIMODAL
+        if analysis['general_complexity'] > 0.7:
+            need_bits |= CAP_COMPLEX
+        return need_bits
+    
+    def _score_models(self, need_bits: int, cost_weight: float, speed_weight: float,
+                      quality_weight: float) -> Tuple[Optional[str], float, str]:
+        """Pick the best available model for a requirement/preference shape"""
+        best_model = None
+        best_score = -1
+        reasoning_parts = []
+        
+        # Quality and total scores per model, unavailable models at -inf
+        scores = score_models(need_bits, self._cap_bits, self._cost_score, self._speed_score,
+                              self._available_mask, cost_weight, speed_weight, quality_weight)
+        quality_score, total = scores[0], scores[1]
+        
+        best = int(total.argmax())
+        if total[best] > best_score:
+            best_score = float(total[best])
+            best_model = self._model_names[best]
+            reasoning_parts = [
+                f"Cost score: {self._cost_score[best]:.2f}",
+                f"Speed score: {self._speed_score[best]:.2f}",
+                f"Quality score: {quality_score[best]:.2f}",
+                f"Total score: {best_score:.2f}"
+            ]
+        
+        return best_model, best_score, "; ".join(reasoning_parts)
     
     def route_query(self, query: str, context: Optional[str] = None, 
-                   user_preferences: Optional[Dict] = None) -> RoutingDecision:
+                   user_preferences: Optional[Dict] = None,
+                   pp: Optional[PreprocessedQuery] = None) -> RoutingDecision:
         """Route a query to the most appropriate model"""
         
-        analysis = self.analyze_query_complexity(query, context)
+        analysis = self.analyze_query_complexity(query, context, pp)
         user_prefs = user_preferences or {}
         
         # Preference weights
@@ -136,160 +309,195 @@ class IntelligentRouter:
         speed_weight = user_prefs.get('speed_priority', 0.2)
         quality_weight = user_prefs.get('quality_priority', 0.1)
         
-        best_model = None
-        best_score = -1
-        reasoning_parts = []
-        
-        for model, info in self.model_info.items():
-            # Check if model is available
-            if model in self.local_models or model in self.cloud_models:
-                score = 0
-                
-                # Cost scoring (higher score for lower cost)
-                cost_score = 1.0 if info['cost_per_token'] == 0 else max(0, 1 - info['cost_per_token'] * 1000)
-                score += cost_score * cost_weight
-                
-                # Speed scoring (higher score for lower latency)
-                speed_score = max(0, 1 - info['avg_latency'] / 2000)
-                score += speed_score * speed_weight
-                
-                # Quality/capability scoring
-                quality_score = 0.5  # Base quality
-                
-                # Boost for specific capabilities
-                if analysis['code_requirement'] > 0.5 and 'code' in info['capabilities']:
-                    quality_score += 0.3
-                elif analysis['multimodal_requirement'] > 0.5 and 'multimodal' in info['capabilities']:
-                    quality_score += 0.4
-                elif analysis['general_complexity'] > 0.7 and 'complex' in info['capabilities']:
-                    quality_score += 0.3
-                
-                score += quality_score * quality_weight
-                
-                if score > best_score:
-                    best_score = score
-                    best_model = model
-                    reasoning_parts = [
-                        f"Cost score: {cost_score:.2f}",
-                        f"Speed score: {speed_score:.2f}",
-                        f"Quality score: {quality_score:.2f}",
-                        f"Total score: {score:.2f}"
-                    ]
+        best_model, best_score, reasoning = self._score_cached(
+            self._requirement_bits(analysis), cost_weight, speed_weight, quality_weight
+        )
         
         if not best_model:
             best_model = self.local_models[0] if self.local_models else 'gpt-4o-mini'
-            reasoning_parts = ["Fallback to default model"]
+            reasoning = "Fallback to default model"
         
         model_info = self.model_info.get(best_model, {})
         
         return RoutingDecision(
             model=best_model,
-            reasoning="; ".join(reasoning_parts),
+            reasoning=reasoning,
             confidence=best_score,
             estimated_cost=model_info.get('cost_per_token', 0) * len(query.split()),
             estimated_latency=model_info.get('avg_latency', 1000)
         )
 
+@dataclass
+class Interaction:
+    """A single query/response exchange held in memory"""
+    query: str
+    response: str
+    timestamp: Optional[float]
+    model_used: Optional[str]
+    cost: float = 0
+    latency: float = 0
+    # Query words, kept so stored queries are never re-tokenized
+    words: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Validate once at write time so readers can use fields directly
+        if not isinstance(self.query, str) or not isinstance(self.response, str):
+            raise TypeError("Interaction query and response must be strings")
+        self.cost = float(self.cost or 0)
+        self.latency = float(self.latency or 0)
+    
+    def to_json(self) -> str:
+        """Serialize the interaction for prompts and export"""
+        return json.dumps({
+            'query': self.query,
+            'response': self.response,
+            'timestamp': self.timestamp,
+            'model_used': self.model_used,
+            'cost': self.cost,
+            'latency': self.latency
+        })
+
+class MemorySnapshot:
+    """Read-only, MemoryBank-like snapshot of a MemoryManager's contents"""
+    
+    def __init__(self, memory: List[Msg]):
+        self.memory = memory
+    
+    def add(self, msg):
+        raise TypeError("memory_bank is a read-only snapshot; use MemoryManager.add_interaction")
+    
+    def get_memory(self) -> List[Msg]:
+        return self.memory
+
 class MemoryManager:
     """Advanced memory management with compression and retrieval"""
     
+    # Upper bound on distinct topic words tracked by the running summary
+    MAX_SUMMARY_TOPICS = 100
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.memory_bank = MemoryBank()
         self.compression_threshold = config.get('compression_threshold', 10)
         self.max_memory_size = config.get('max_memory_size', 100)
+        
+        # Interaction records, oldest first, bounded by _compress_memory rather
+        # than deque maxlen so no record is ever dropped behind the index's back
+        self._records: Deque[Interaction] = deque()
+        self._evicted = 0
+        
+        # Running summary of every record rolled out of the buffer
+        self._summary: Optional[Dict[str, Any]] = None
+        self._summary_cost = 0
+        self._summary_topics: Counter = Counter()
+        
+        # Inverted index from query words to record ids, ascending
+        self._inverted: Dict[str, Deque[int]] = defaultdict(deque)
+    
+    @property
+    def records(self) -> Deque[Interaction]:
+        """Interactions currently held in memory, oldest first"""
+        return self._records
+    
+    @property
+    def memory_size(self) -> int:
+        """Number of memory entries, counting the summary"""
+        return len(self._records) + (self._summary is not None)
+    
+    @property
+    def memory_bank(self) -> MemorySnapshot:
+        """Read-only snapshot of the summary and records, built on access"""
+        memory = []
+        if self._summary is not None:
+            memory.append(Msg(content=json.dumps(self._summary), role="summary"))
+        for record in self._records:
+            memory.append(Msg(content=record.to_json(), role="memory"))
+        return MemorySnapshot(memory)
     
-    def add_interaction(self, query: str, response: str, metadata: Dict[str, Any]):
+    def add_interaction(self, query: str, response: str, metadata: Dict[str, Any],
+                        pp: Optional[PreprocessedQuery] = None):
         """Add an interaction to memory with metadata"""
-        interaction = {
-            'query': query,
-            'response': response,
-            'timestamp': metadata.get('timestamp'),
-            'model_used': metadata.get('model'),
-            'cost': metadata.get('cost', 0),
-            'latency': metadata.get('latency', 0)
-        }
-        
-        self.memory_bank.add(Msg(content=json.dumps(interaction), role="memory"))
+        pp = pp if pp is not None else _preprocess(query)
+        interaction = Interaction(
+            query=query,
+            response=response,
+            timestamp=metadata.get('timestamp'),
+            model_used=metadata.get('model'),
+            cost=metadata.get('cost', 0),
+            latency=metadata.get('latency', 0),
+            words=pp[1]
+        )
         
-        # Compress memory if needed
-        if len(self.memory_bank.get_memory()) > self.max_memory_size:
+        # Compress memory before it would grow past max_memory_size
+        if self.memory_size >= self.max_memory_size:
             self._compress_memory()
+        
+        record_id = self._evicted + len(self._records)
+        for word in interaction.words:
+            self._inverted[word].append(record_id)
+        self._records.append(interaction)
+    
+    def _evict_oldest(self) -> Interaction:
+        """Pop the oldest record and drop it from the inverted index"""
+        record = self._records.popleft()
+        for word in record.words:
+            # Ids are ascending, so the evicted one is at the front
+            postings = self._inverted[word]
+            postings.popleft()
+            if not postings:
+                del self._inverted[word]
+        self._evicted += 1
+        return record
     
     def _compress_memory(self):
         """Compress old memories to save space"""
         # This is a simplified compression - in practice, you'd use
         # semantic compression with embeddings
-        memory = self.memory_bank.get_memory()
-        
-        if len(memory) > self.compression_threshold:
-            # Keep recent memories, compress older ones
-            recent_memories = memory[-self.compression_threshold:]
-            old_memories = memory[:-self.compression_threshold]
-            
-            # Create a compressed summary of old memories
-            summary = self._create_summary(old_memories)
-            
-            # Reset memory with summary + recent memories
-            self.memory_bank = MemoryBank()
-            self.memory_bank.add(Msg(content=summary, role="summary"))
-            
-            for msg in recent_memories:
-                self.memory_bank.add(msg)
-    
-    def _create_summary(self, memories: List) -> str:
-        """Create a summary of old memories"""
+        
+        # Keep recent memories, counting the one being added and leaving
+        # room for the summary, compress older ones
+        keep = max(min(self.compression_threshold, self.max_memory_size - 1) - 1, 0)
+        old_records = [self._evict_oldest() for _ in range(len(self._records) - keep)]
+        
+        if old_records:
+            self._summary = self._create_summary(old_records)
+    
+    def _create_summary(self, records: List[Interaction]) -> Dict[str, Any]:
+        """Merge old memories into the running summary"""
         # Simplified summarization - in practice, use an LLM
-        topics = set()
-        total_cost = 0
-        total_interactions = len(memories)
-        
-        for msg in memories:
-            try:
-                data = json.loads(msg.content)
-                # Extract topics from queries (simplified)
-                query_words = data.get('query', '').lower().split()
-                topics.update(word for word in query_words if len(word) > 4)
-                total_cost += data.get('cost', 0)
-            except:
-                continue
-        
-        summary = {
+        for record in records:
+            # Extract topics from queries (simplified)
+            self._summary_topics.update(word for word in record.words if len(word) > 4)
+            self._summary_cost += record.cost
+        
+        if len(self._summary_topics) > self.MAX_SUMMARY_TOPICS:
+            self._summary_topics = Counter(dict(self._summary_topics.most_common(self.MAX_SUMMARY_TOPICS)))
+        
+        return {
             'type': 'compressed_summary',
-            'period': f"{total_interactions} interactions",
-            'total_cost': total_cost,
-            'main_topics': list(topics)[:10],  # Top 10 topics
+            'period': f"{self._evicted} interactions",
+            'total_cost': self._summary_cost,
+            'main_topics': [word for word, _ in self._summary_topics.most_common(10)],  # Top 10 topics
             'compressed_at': 'timestamp_here'
         }
-        
-        return json.dumps(summary)
     
-    def retrieve_relevant_context(self, query: str, max_items: int = 5) -> str:
+    def retrieve_relevant_context(self, query: str, max_items: int = 5,
+                                  pp: Optional[PreprocessedQuery] = None) -> str:
         """Retrieve relevant context for a query"""
         # Simplified retrieval - in practice, use semantic search
-        memory = self.memory_bank.get_memory()
-        relevant_items = []
-        
-        query_words = set(query.lower().split())
-        
-        for msg in reversed(memory):  # Start with most recent
-            try:
-                if msg.role == "summary":
-                    # Always include summaries
-                    relevant_items.append(msg.content)
-                else:
-                    data = json.loads(msg.content)
-                    msg_words = set(data.get('query', '').lower().split())
-                    
-                    # Simple word overlap scoring
-                    overlap = len(query_words.intersection(msg_words))
-                    if overlap > 0:
-                        relevant_items.append(msg.content)
-                
-                if len(relevant_items) >= max_items:
-                    break
-            except:
-                continue
+        query_words = pp[1] if pp is not None else _preprocess(query)[1]
+        
+        # Simple word overlap scoring over the inverted index
+        overlap = Counter()
+        for word in query_words:
+            overlap.update(self._inverted.get(word, ()))
+        
+        # Highest overlap first, most recent first among ties
+        best = heapq.nlargest(max_items, overlap.items(), key=lambda item: (item[1], item[0]))
+        relevant_items = [self._records[record_id - self._evicted].to_json() for record_id, _ in best]
+        
+        # Summaries are the oldest entries and always included
+        if self._summary is not None and len(relevant_items) < max_items:
+            relevant_items.append(json.dumps(self._summary))
         
         return "\n".join(relevant_items)
 
@@ -312,24 +520,26 @@ class OrchestratorAgent(Agent):
     
     def reply(self, x: Msg) -> Msg:
         """Process a message and return a response"""
-        import time
-        start_time = time.time()
+        start_time = wall_time()
+        start_counter = perf_counter()
         
         # Extract query
         query = x.content if hasattr(x, 'content') else str(x)
         
+        # Lowercase and tokenize once for routing and memory
+        pp = _preprocess(query)
+        
         # Get relevant context from memory
-        context = self.memory_manager.retrieve_relevant_context(query)
+        context = self.memory_manager.retrieve_relevant_context(query, pp=pp)
         
         # Route the query
-        routing_decision = self.router.route_query(query, context)
+        routing_decision = self.router.route_query(query, context, pp=pp)
         
         # Execute the query (simplified - in practice, call the actual model)
         response = self._execute_query(query, routing_decision, context)
         
-        # Calculate metrics
-        end_time = time.time()
-        latency = (end_time - start_time) * 1000  # Convert to milliseconds
+        # Calculate metrics, timing latency on the monotonic clock
+        latency = (perf_counter() - start_counter) * 1000.0  # Convert to milliseconds
         
         # Store interaction in memory
         metadata = {
@@ -340,7 +550,7 @@ class OrchestratorAgent(Agent):
             'routing_reasoning': routing_decision.reasoning
         }
         
-        self.memory_manager.add_interaction(query, response, metadata)
+        self.memory_manager.add_interaction(query, response, metadata, pp)
         
         # Create response message
         response_msg = Msg(content=response, role="assistant")
@@ -378,29 +588,13 @@ In a real implementation, this would be the actual model response."""
     
     def get_stats(self) -> Dict[str, Any]:
         """Get orchestrator statistics"""
-        memory = self.memory_manager.memory_bank.get_memory()
-        
-        total_interactions = 0
-        total_cost = 0
-        model_usage = {}
-        
-        for msg in memory:
-            try:
-                if msg.role == "memory":
-                    data = json.loads(msg.content)
-                    total_interactions += 1
-                    total_cost += data.get('cost', 0)
-                    
-                    model = data.get('model_used', 'unknown')
-                    model_usage[model] = model_usage.get(model, 0) + 1
-            except:
-                continue
+        records = self.memory_manager.records
         
         return {
-            'total_interactions': total_interactions,
-            'total_cost': total_cost,
-            'model_usage': model_usage,
-            'memory_size': len(memory),
+            'total_interactions': len(records),
+            'total_cost': math.fsum(record.cost for record in records),
+            'model_usage': dict(Counter(record.model_used for record in records)),
+            'memory_size': self.memory_manager.memory_size,
             'available_models': {
                 'local': self.router.local_models,
                 'cloud': self.router.cloud_models
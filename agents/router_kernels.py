@@ -0,0 +1,82 @@
+"""
+Router Kernels
+
+Keyword scanning and scoring kernels for the IntelligentRouter. Running this
+module compiles them ahead of time with Numba into a _router_kernels extension
+next to this file:
+
+    python agents/router_kernels.py
+
+When that extension has been built, importing this module swaps the compiled
+kernels in for the plain Python/NumPy definitions below and sets AOT_COMPILED.
+Nothing is JIT-compiled at import or on the first query.
+"""
+
+import os
+
+import numpy as np
+
+# Model capability bits, used both for model capabilities and query requirements
+CAP_CODE = 1 << 0
+CAP_MULTIMODAL = 1 << 1
+CAP_COMPLEX = 1 << 2
+CAP_REASONING = 1 << 3
+CAP_ADVANCED = 1 << 4
+CAP_GENERAL = 1 << 5
+CAP_PROGRAMMING = 1 << 6
+
+def scan_keywords(buf, goto, out_mask, all_mask):
+    """Run a keyword DFA over a byte buffer, returning the matched category bits"""
+    state = 0
+    hits = 0
+    for byte in buf:
+        state = goto[state, byte]
+        hits |= out_mask[state]
+        if hits == all_mask:
+            break
+    return hits
+
+def score_models(need_bits, cap_bits, cost_score, speed_score, available,
+                 cost_weight, speed_weight, quality_weight):
+    """Score every model for a query, returning rows of (quality, total) scores"""
+    # Quality/capability scoring, boosting the first matching capability
+    hits = cap_bits & need_bits
+    code_hit = (hits & CAP_CODE) != 0
+    multi_hit = ((hits & CAP_MULTIMODAL) != 0) & ~code_hit
+    complex_hit = ((hits & CAP_COMPLEX) != 0) & ~code_hit & ~multi_hit
+
+    scores = np.empty((2, cap_bits.shape[0]), dtype=np.float64)
+    scores[0] = 0.5 + 0.3 * code_hit + 0.4 * multi_hit + 0.3 * complex_hit
+    scores[1] = (cost_score * cost_weight
+                 + speed_score * speed_weight
+                 + scores[0] * quality_weight)
+
+    # Unavailable models can never win
+    for i in range(available.shape[0]):
+        if not available[i]:
+            scores[1, i] = -np.inf
+
+    return scores
+
+AOT_COMPILED = False
+
+if __name__ == "__main__":
+    from numba.pycc import CC
+
+    cc = CC('_router_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export('scan_keywords', 'i8(u1[:], u2[:,:], u1[:], i8)')(scan_keywords)
+    cc.export('score_models', 'f8[:,:](u1, u1[:], f8[:], f8[:], b1[:], f8, f8, f8)')(score_models)
+    cc.compile()
+
+    print(f"✅ Compiled router kernels into {cc.output_dir}")
+else:
+    # Swap in the ahead-of-time compiled kernels when they have been built
+    try:
+        if __package__:
+            from ._router_kernels import scan_keywords, score_models
+        else:
+            from _router_kernels import scan_keywords, score_models
+        AOT_COMPILED = True
+    except ModuleNotFoundError:
+        pass
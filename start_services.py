@@ -7,31 +7,38 @@ It handles different deployment environments, GPU configurations, and service de
 """
 
 import os
+import re
 import sys
+import asyncio
 import subprocess
 import time
 import argparse
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# KEY=value lines; leading whitespace, blank lines and '#' comments are skipped
+_ENV_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*|)=(.*?)\s*$', re.MULTILINE)
 
 class ServiceManager:
     def __init__(self):
         self.project_root = Path(__file__).parent
         self.env_file = self.project_root / ".env"
         self.compose_file = self.project_root / "docker-compose.yml"
+        self._print_lock = threading.Lock()
+    
+    def _log(self, message: str):
+        """Print a progress line without interleaving across worker threads"""
+        with self._print_lock:
+            print(message, flush=True)
         
     def load_environment(self) -> Dict[str, str]:
         """Load environment variables from .env file"""
-        env_vars = {}
-        if self.env_file.exists():
-            with open(self.env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_vars[key] = value
-        return env_vars
+        if not self.env_file.exists():
+            return {}
+        return dict(_ENV_LINE_RE.findall(self.env_file.read_text()))
     
     def check_prerequisites(self) -> bool:
         """Check if all prerequisites are met"""
@@ -95,11 +102,10 @@ class ServiceManager:
     def generate_secrets(self) -> Dict[str, str]:
         """Generate secure random secrets for services"""
         import secrets
-        import string
         
         def generate_key(length: int = 32) -> str:
-            alphabet = string.ascii_letters + string.digits
-            return ''.join(secrets.choice(alphabet) for _ in range(length))
+            # One CSPRNG draw per key; each URL-safe character carries 6 random bits
+            return secrets.token_urlsafe(length)[:length]
         
         return {
             'POSTGRES_PASSWORD': generate_key(16),
@@ -160,48 +166,99 @@ class ServiceManager:
     def pull_models(self, models: List[str]):
         """Pull required Ollama models"""
         print("📥 Pulling required models...")
+        asyncio.run(self._pull_models_async(models))
+    
+    async def _pull_models_async(self, models: List[str]):
+        """Pull all models concurrently"""
+        await asyncio.gather(*(self._pull_one(model) for model in models))
+    
+    async def _pull_one(self, model: str, timeout: int = 300):
+        """Pull a single Ollama model"""
+        self._log(f"  Pulling {model}...")
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'docker', 'exec', 'ollama', 'ollama', 'pull', model,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            self._log(f"  ⚠️ Error pulling {model}: {e}")
+            return
         
-        for model in models:
-            print(f"  Pulling {model}...")
-            try:
-                result = subprocess.run([
-                    'docker', 'exec', 'ollama', 'ollama', 'pull', model
-                ], capture_output=True, text=True, timeout=300)
-                
-                if result.returncode == 0:
-                    print(f"  ✅ {model} pulled successfully")
-                else:
-                    print(f"  ⚠️ Failed to pull {model}: {result.stderr}")
-            except subprocess.TimeoutExpired:
-                print(f"  ⚠️ Timeout pulling {model}")
-            except Exception as e:
-                print(f"  ⚠️ Error pulling {model}: {e}")
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._log(f"  ⚠️ Timeout pulling {model}")
+            return
+        finally:
+            # Don't leave pulls running after a timeout or Ctrl-C
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        
+        if process.returncode == 0:
+            self._log(f"  ✅ {model} pulled successfully")
+        else:
+            self._log(f"  ⚠️ Failed to pull {model}: {stderr.decode(errors='replace')}")
     
-    def wait_for_service(self, service_name: str, port: int, timeout: int = 60):
-        """Wait for a service to become available"""
-        print(f"⏳ Waiting for {service_name} on port {port}...")
+    def wait_for_service(self, service_name: str, port: int, timeout: int = 60,
+                         stop: Optional[threading.Event] = None):
+        """Wait for a service to become available, giving up early once stop is set"""
+        self._log(f"⏳ Waiting for {service_name} on port {port}...")
         
+        import errno
         import socket
         start_time = time.time()
         
+        # Probe quickly at first, backing off while the port stays closed
+        delay = 0.05
+        
         while time.time() - start_time < timeout:
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex(('localhost', port))
-                sock.close()
-                
-                if result == 0:
-                    print(f"✅ {service_name} is ready")
-                    return True
-            except:
-                pass
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(1)
+                    result = sock.connect_ex(('localhost', port))
+            except OSError:
+                result = None
             
-            time.sleep(2)
-        
-        print(f"⚠️ {service_name} did not become ready within {timeout} seconds")
+            if result == 0:
+                self._log(f"✅ {service_name} is ready")
+                return True
+            
+            if stop is None:
+                time.sleep(delay)
+            elif stop.wait(delay):
+                return False
+            
+            # A refused connection fails fast, so keep polling often; timeouts
+            # and other errors mean the probe itself is slow, so use the cap
+            if result == errno.ECONNREFUSED:
+                delay = min(delay * 1.5, 0.5)
+            else:
+                delay = 0.5
+        
+        self._log(f"⚠️ {service_name} did not become ready within {timeout} seconds")
         return False
     
+    def wait_for_services(self, services: List[Tuple[str, int]]) -> List[bool]:
+        """Wait for several services concurrently"""
+        if not services:
+            return []
+        
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(services))
+        try:
+            futures = [
+                executor.submit(self.wait_for_service, service_name, port, stop=stop)
+                for service_name, port in services
+            ]
+            return [future.result() for future in futures]
+        except KeyboardInterrupt:
+            # Stop the workers' poll loops so Ctrl-C isn't held up by their timeouts
+            stop.set()
+            raise
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def start_services(self, environment: str, gpu_profile: str):
         """Start all services in the correct order"""
         print("🚀 Starting LLM Orchestrator services...")
@@ -229,9 +286,11 @@ class ServiceManager:
             subprocess.run(compose_cmd + ['up', '-d', service], check=True)
         
         # Wait for databases to be ready
-        self.wait_for_service('PostgreSQL', 5432)
-        self.wait_for_service('Qdrant', 6333)
-        self.wait_for_service('Neo4j', 7474)
+        self.wait_for_services([
+            ('PostgreSQL', 5432),
+            ('Qdrant', 6333),
+            ('Neo4j', 7474),
+        ])
         
         # Start Ollama
         print("🤖 Starting Ollama...")
@@ -254,8 +313,7 @@ class ServiceManager:
             ('Langfuse', 3001),
         ]
         
-        for service_name, port in services_to_check:
-            self.wait_for_service(service_name, port)
+        self.wait_for_services(services_to_check)
     
     def show_status(self):
         """Show status of all services"""